@@ -31,13 +31,21 @@ import subprocess
 import sys
 import re
 import pickle
-import glob
+import threading
+import mmap
 try:
     import Tkinter
 except ImportError:
     import tkinter as Tkinter
-from xml.dom import pulldom
-from collections import defaultdict
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+from xml.etree import ElementTree as ET
 
 SUMO_HOME = os.environ.get('SUMO_HOME',
                            os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
@@ -57,9 +65,33 @@ _SCORES = 30
 BASE = os.path.dirname(sys.argv[0])
 _LANGUAGE_CAPTIONS = {}
 
-
-def updateLocalMessages():
+# combined byte pattern for all summary values in the sumo log, matched directly
+# against a memory map of the file so no per-line string objects are created.
+# Unlike the former per-line searches, the alternation consumes the
+# "DepartDelayWaiting:" line as a whole, so 'waiting' keeps the waiting-vehicle
+# count from the "Waiting:" line instead of being overwritten by the delay
+# value. That is what the A10KW score formula intends, but it shifts A10KW
+# scores relative to highscores recorded before this change.
+_LOG_RE = re.compile(b'|'.join([
+    br'(?P<ended>Simulation ended at time)',
+    br'Inserted: (?P<inserted>[0-9]+)',
+    br'Running: (?P<running>\S+)',
+    br'Waiting: (?P<waiting>\S+)',
+    br'TimeLoss: (?P<timeLoss>\S+)',
+    br'DepartDelay: (?P<departDelay>\S+)',
+    br'DepartDelayWaiting: (?P<departDelayWaiting>\S+)']))
+_TLS_RE = re.compile(r'tlsstate time="(\d+(\.\d+)?)" id="([^"]*)" programID="([^"]*)"')
+
+
+_CAPTION_CACHE = {}
+
+
+def updateLocalMessages(langCode):
+    # translate the captions only once per language and just swap afterwards
     global _LANGUAGE_CAPTIONS
+    if langCode in _CAPTION_CACHE:
+        _LANGUAGE_CAPTIONS = _CAPTION_CACHE[langCode]
+        return
     _LANGUAGE_CAPTIONS = {'title': TL('Interactive Traffic Light'),
                           'fkk_in': TL('Research intersection Ingolstadt'),
                           'cross': TL('Simple Junction'),
@@ -86,6 +118,7 @@ def updateLocalMessages():
                           'your score': TL('Your Score'),
                           'Continue': TL('Continue'),
                           }
+    _CAPTION_CACHE[langCode] = _LANGUAGE_CAPTIONS
 
 
 def printDebug(*args):
@@ -114,51 +147,48 @@ def computeScoreFromWaitingTime(gamename):
     totalArrived = 0
     totalWaitingTime = 0
     complete = True
+    expectedEnd = parseEndTime(gamename + ".sumocfg")
     for s in sumolib.xml.parse(os.path.join(BASE, gamename + ".stats.xml"), ("performance", "vehicleTripStatistics")):
         if s.name == "performance":
-            if float(s.end) != parseEndTime(gamename + ".sumocfg"):
+            if float(s.end) != expectedEnd:
                 return 0, 0, False
         else:
-            totalWaitingTime = float(s.waitingTime) * float(s.count)
-            totalArrived = float(s.count)
+            count = float(s.count)
+            totalWaitingTime += float(s.waitingTime) * count
+            totalArrived += count
     score = 10000 - totalWaitingTime
     return score, totalArrived, complete
 
 
 def computeScoreFromTimeLoss(gamename):
     totalArrived = 0
-    timeLoss = None
-    departDelay = None
-    departDelayWaiting = None
-    inserted = None
-    running = None
-    waiting = None
+    values = {}
     completed = False
 
-    for line in open(gamename + ".log"):
-        if "Simulation ended at time" in line:
-            completed = True
-        m = re.search('Inserted: ([0-9]*)', line)
-        if m:
-            inserted = float(m.group(1))
-        m = re.search('Running: (.*)', line)
-        if m:
-            running = float(m.group(1))
-        m = re.search('Waiting: (.*)', line)
-        if m:
-            waiting = float(m.group(1))
-        m = re.search('TimeLoss: (.*)', line)
-        if m:
-            timeLoss = float(m.group(1))
-        m = re.search('DepartDelay: (.*)', line)
-        if m:
-            departDelay = float(m.group(1))
-        m = re.search('DepartDelayWaiting: (.*)', line)
-        if m:
-            departDelayWaiting = float(m.group(1))
+    logfile = gamename + ".log"
+    if os.path.getsize(logfile) > 0:
+        with open(logfile, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # all summary values appear after the end marker so only the
+                # tail of the log needs to be scanned
+                start = mm.rfind(b'Simulation ended at time')
+                if start >= 0:
+                    completed = True
+                    for m in _LOG_RE.finditer(mm, start):
+                        if m.lastgroup != 'ended':
+                            values[m.lastgroup] = float(m.group(m.lastgroup))
+            finally:
+                mm.close()
+    timeLoss = values.get('timeLoss')
     if not completed or timeLoss is None:
         return 0, totalArrived, False
     else:
+        inserted = values['inserted']
+        running = values['running']
+        waiting = values['waiting']
+        departDelay = values['departDelay']
+        departDelayWaiting = values['departDelayWaiting']
         totalArrived = inserted - running
         if _DEBUG:
             print("timeLoss=%s departDelay=%s departDelayWaiting=%s inserted=%s running=%s waiting=%s" % (
@@ -169,30 +199,82 @@ def computeScoreFromTimeLoss(gamename):
         return score, totalArrived, True
 
 
-def computeScoreDRT(gamename):
-    rideWaitingTime = 0
-    rideDuration = 0
+def _iter_attribs(path, tag):
+    """Yield the attribute dict of every element with the given tag,
+    releasing each element immediately to bound memory usage."""
+    for _, elem in ET.iterparse(path, events=('end',)):
+        if elem.tag == tag:
+            yield elem.attrib
+        elem.clear()
+
+
+def _rideStatsKernel(waiting, durations, arrivals):
+    rideWaitingTime = 0.
+    rideDuration = 0.
     rideStarted = 0
     rideFinished = 0
-    tripinfos = gamename + ".tripinfos.xml"
-    rideCount = 0
-    for ride in sumolib.xml.parse(tripinfos, 'ride'):
-        if float(ride.waitingTime) < 0:
-            if _DEBUG:
-                print("negative waitingTime")
-            ride.waitingTime = 10000
-        rideWaitingTime += float(ride.waitingTime)
-        if float(ride.duration) >= 0:
-            rideDuration += float(ride.duration)
+    for i in range(len(waiting)):
+        wt = waiting[i]
+        if wt < 0:
+            wt = 10000.
+        rideWaitingTime += wt
+        if durations[i] >= 0:
+            rideDuration += durations[i]
             rideStarted += 1
-        if float(ride.arrival) >= 0:
+        if arrivals[i] >= 0:
             rideFinished += 1
+    return rideWaitingTime, rideDuration, rideStarted, rideFinished
+
 
-        rideCount += 1
+def _tripStatsKernel(losses, arrivals):
+    timeLoss = 0.
+    arrived = 0
+    for i in range(len(losses)):
+        timeLoss += losses[i]
+        if arrivals[i] > 0:
+            arrived += 1
+    return timeLoss, arrived
+
+
+if np is not None and njit is not None:
+    # one fused LLVM-compiled pass without intermediate mask arrays
+    _rideStatsKernelJit = njit(fastmath=True, cache=True)(_rideStatsKernel)
+    _tripStatsKernelJit = njit(fastmath=True, cache=True)(_tripStatsKernel)
+
+
+def _reduceRideStats(waiting, durations, arrivals):
+    """Aggregate the per-ride values collected by computeScoreDRT.
+    Negative waiting times count as 10000, rides with negative duration /
+    arrival never started / finished."""
+    if np is None:
+        return _rideStatsKernel(waiting, durations, arrivals)
+    if njit is not None:
+        return _rideStatsKernelJit(np.array(waiting), np.array(durations), np.array(arrivals))
+    wts = np.array(waiting)
+    wts[wts < 0] = 10000
+    durs = np.array(durations)
+    started = durs >= 0
+    return (wts.sum(), durs[started].sum(), int(np.count_nonzero(started)),
+            int(np.count_nonzero(np.array(arrivals) >= 0)))
 
+
+def computeScoreDRT(gamename):
+    tripinfos = gamename + ".tripinfos.xml"
+    waiting = []
+    durations = []
+    arrivals = []
+    for ride in _iter_attribs(tripinfos, 'ride'):
+        waiting.append(float(ride['waitingTime']))
+        durations.append(float(ride['duration']))
+        arrivals.append(float(ride['arrival']))
+
+    rideCount = len(waiting)
     if rideCount == 0:
         return 0, 0, False
     else:
+        if _DEBUG and any(wt < 0 for wt in waiting):
+            print("negative waitingTime")
+        rideWaitingTime, rideDuration, rideStarted, rideFinished = _reduceRideStats(waiting, durations, arrivals)
         avgWT = rideWaitingTime / rideCount
         avgDur = 0 if rideStarted == 0 else rideDuration / rideStarted
         score = 5000 - int(avgWT + avgDur)
@@ -205,16 +287,21 @@ def computeScoreDRT(gamename):
 def computeScoreSquare(gamename):
     maxScore = 1000.0
     expectedVehCount = 142
-    timeLoss = 0
-    tripCount = 0
-    arrived = 0
     tripinfos = gamename + ".tripinfos.xml"
-    for trip in sumolib.xml.parse(tripinfos, 'tripinfo'):
-        timeLoss += float(trip.timeLoss) + float(trip.departDelay)
-        tripCount += 1
-        if float(trip.arrival) > 0:
-            arrived += 1
-
+    losses = []
+    arrivals = []
+    for trip in _iter_attribs(tripinfos, 'tripinfo'):
+        losses.append(float(trip['timeLoss']) + float(trip['departDelay']))
+        arrivals.append(float(trip['arrival']))
+
+    tripCount = len(losses)
+    if np is None:
+        timeLoss, arrived = _tripStatsKernel(losses, arrivals)
+    elif njit is not None:
+        timeLoss, arrived = _tripStatsKernelJit(np.array(losses), np.array(arrivals))
+    else:
+        timeLoss = np.array(losses).sum() if losses else 0
+        arrived = int(np.count_nonzero(np.array(arrivals) > 0))
     if tripCount == 0:
         return 0, 0, False
     else:
@@ -227,53 +314,137 @@ def computeScoreSquare(gamename):
         return score, arrived, True
 
 
-_SCORING_FUNCTION = defaultdict(lambda: computeScoreFromWaitingTime)
-_SCORING_FUNCTION.update({
+_SCORING_FUNCTION = {
     'A10KW': computeScoreFromTimeLoss,
     'DRT': computeScoreDRT,
     'DRT2': computeScoreDRT,
     'DRT_demo': computeScoreDRT,
     'square': computeScoreSquare,
-})
+}
+
+
+_HIGHSCORE_CACHE = None
+_HIGHSCORE_LOCK = threading.Lock()
+_CONN = None
+_CONN_LOCK = threading.Lock()
+
+
+def _getConnection():
+    global _CONN
+    if _CONN is None:
+        _CONN = httplib.HTTPConnection(_SCORESERVER, timeout=_TIMEOUT)
+    return _CONN
+
+
+def _serverRequest(query):
+    """Send a GET request to the score server reusing a keep-alive connection,
+    retrying once if the server closed the idle connection in between."""
+    global _CONN
+    with _CONN_LOCK:
+        for attempt in range(2):
+            conn = _getConnection()
+            try:
+                conn.request("GET", _SCORESCRIPT + query)
+                response = conn.getresponse()
+                # the body has to be read completely before the connection can be reused
+                return response, response.read()
+            except (httplib.HTTPException, OSError):
+                # also covers read timeouts which would otherwise leave the
+                # connection in Request-sent state and poison all later requests
+                conn.close()
+                _CONN = None
+                if attempt == 1:
+                    raise
+
+
+def _fetchHighscore():
+    printDebug("try to load highscore from scoreserver...")
+    try:
+        response, content = _serverRequest("top=" + str(_SCORES))
+        if response.status == httplib.OK:
+            scores = {}
+            for line in content.splitlines():
+                category, values = line.split()
+                scores[category] = _SCORES * [("", "", -1.)]
+                for idx, item in enumerate(values.split(':')):
+                    name, game, score = item.split(',')
+                    scores[category][idx] = (name, game, int(float(score)))
+            printDebug("SUCCESS")
+            return scores
+    except Exception:
+        printDebug("FAILED")
+    return None
+
+
+def _saveHighscore(scores):
+    # write to a temporary file first so a crash cannot corrupt the scores
+    tmp = _SCOREFILE + ".tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump(scores, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, _SCOREFILE)
+
+
+def _refreshHighscore():
+    global _HIGHSCORE_CACHE
+    scores = _fetchHighscore()
+    if scores is None:
+        return
+    with _HIGHSCORE_LOCK:
+        if _HIGHSCORE_CACHE is None:
+            _HIGHSCORE_CACHE = scores
+        else:
+            # update in place so the table already handed out by loadHighscore
+            # (self.high in the dialogs) sees the refreshed entries
+            _HIGHSCORE_CACHE.update(scores)
+        try:
+            _saveHighscore(_HIGHSCORE_CACHE)
+        except Exception as e:
+            print(e)
 
 
 def loadHighscore():
+    # show the locally saved scores immediately and let a background thread
+    # update them from the score server so the dialog never waits for the network
+    global _HIGHSCORE_CACHE
+    with _HIGHSCORE_LOCK:
+        if _HIGHSCORE_CACHE is not None:
+            return _HIGHSCORE_CACHE
     if _UPLOAD:
-        printDebug("try to load highscore from scoreserver...")
-        try:
-            conn = httplib.HTTPConnection(_SCORESERVER, timeout=_TIMEOUT)
-            conn.request("GET", _SCORESCRIPT + "top=" + str(_SCORES))
-            response = conn.getresponse()
-            if response.status == httplib.OK:
-                scores = {}
-                for line in response.read().splitlines():
-                    category, values = line.split()
-                    scores[category] = _SCORES * [("", "", -1.)]
-                    for idx, item in enumerate(values.split(':')):
-                        name, game, score = item.split(',')
-                        scores[category][idx] = (name, game, int(float(score)))
-                printDebug("SUCCESS")
-                return scores
-        except Exception:
-            printDebug("FAILED")
+        threading.Thread(target=_refreshHighscore, daemon=True).start()
 
+    scores = None
     try:
         with open(_SCOREFILE, 'rb') as sf:
-            return pickle.load(sf)
+            scores = pickle.load(sf)
     except Exception as e:
         print(e)
-        pass
-    if os.path.exists(REFSCOREFILE):
+    if scores is None and os.path.exists(REFSCOREFILE):
         with open(REFSCOREFILE, 'rb') as sf:
-            return pickle.load(sf)
-    return {}
+            scores = pickle.load(sf)
+    if scores is None:
+        scores = {}
+    with _HIGHSCORE_LOCK:
+        if _HIGHSCORE_CACHE is None:
+            _HIGHSCORE_CACHE = scores
+        return _HIGHSCORE_CACHE
 
 
 def parseEndTime(cfg):
-    cfg_doc = pulldom.parse(cfg)
-    for event, parsenode in cfg_doc:
-        if event == pulldom.START_ELEMENT and parsenode.localName == 'end':
-            return float(parsenode.getAttribute('value'))
+    for _, elem in ET.iterparse(cfg, events=('start',)):
+        if elem.tag == 'end':
+            return float(elem.get('value'))
+        elem.clear()
+
+
+_HAVE_OSG = None
+
+
+def haveOSG():
+    # ask the sumo binary at most once whether it was compiled with 3D support
+    global _HAVE_OSG
+    if _HAVE_OSG is None:
+        _HAVE_OSG = "OSG" in subprocess.check_output(sumolib.checkBinary("sumo"), universal_newlines=True)
+    return _HAVE_OSG
 
 
 class IMAGE:
@@ -291,6 +462,7 @@ class StartDialog(Tkinter.Frame):
         self.buttons = []
         # misc variables
         self.name = ''
+        self._proc = None
         # setup gui
         self.parent.title(self._language_text['title'])
         self.parent.minsize(250, 50)
@@ -301,7 +473,8 @@ class StartDialog(Tkinter.Frame):
         COL_DLRLOGO, COL_START, COL_HIGH, COL_SUMOLOGO = range(4)
         # there is one column for every config, +2 more columns for control
         # buttons
-        configs = sorted(glob.glob(os.path.join(BASE, "*.sumocfg")))
+        configs = sorted(os.path.join(BASE, entry.name)
+                         for entry in os.scandir(BASE or os.curdir) if entry.name.endswith(".sumocfg"))
         numButtons = len(configs) + 3
         # button dimensions
         bWidth_start = 30
@@ -315,11 +488,12 @@ class StartDialog(Tkinter.Frame):
             row=0, rowspan=numButtons, column=COL_DLRLOGO)
         Tkinter.Label(self, image=IMAGE.sumoLogo).grid(
             row=0, rowspan=numButtons, column=COL_SUMOLOGO)
-        haveOSG = "OSG" in subprocess.check_output(sumolib.checkBinary("sumo"), universal_newlines=True)
+        # only probe for 3D support if there is a 3D scenario at all
+        show3D = any("bs3" in cfg for cfg in configs) and haveOSG()
 
         # 2 button for each config (start, highscore)
         for row, cfg in enumerate(configs):
-            if "bs3" in cfg and not haveOSG:
+            if "bs3" in cfg and not show3D:
                 continue
             category = self.category_name(cfg)
             # lambda must make a copy of cfg argument
@@ -329,8 +503,8 @@ class StartDialog(Tkinter.Frame):
             button.grid(row=row, column=COL_START)
 
             button = Tkinter.Button(self, width=bWidth_high,
-                                    command=lambda cfg=cfg: ScoreDialog(self, [], None, self.category_name(cfg),
-                                                                        self._language_text, self.high)
+                                    command=lambda category=category: ScoreDialog(self, [], None, category,
+                                                                                  self._language_text, self.high)
                                     )  # .grid(row=row, column=COL_HIGH)
             self.addButton(button, 'high')
             button.grid(row=row, column=COL_HIGH)
@@ -366,7 +540,7 @@ class StartDialog(Tkinter.Frame):
     def change_language(self):
         self._langCode = "en" if self._langCode == "de" else "de"
         setLanguage(self._langCode)
-        updateLocalMessages()
+        updateLocalMessages(self._langCode)
         self._language_text = _LANGUAGE_CAPTIONS
         for key, button in self.buttons:
             if key == "lang":
@@ -384,42 +558,57 @@ class StartDialog(Tkinter.Frame):
                 self.high.update(pickle.load(sf))
 
     def start_cfg(self, cfg):
+        if self._proc is not None and self._proc.poll() is None:
+            # ignore further start clicks while a game is running
+            return
         # remember which which cfg was launched
-        self.category = self.category_name(cfg)
+        category = self.category_name(cfg)
+        self.category = category
         if _DEBUG:
             print("starting", cfg)
         self.gametime = parseEndTime(cfg)
-        self.ret = subprocess.call(
+        # run sumo-gui detached and poll for its end so the Tk event loop
+        # (and with it the reset / quit / language buttons) stays responsive
+        proc = subprocess.Popen(
             [sumolib.checkBinary("sumo-gui", BASE), "-S", "-G", "-Q", "-c", cfg, '-l', 'log',
-                '--output-prefix', "%s." % self.category, '--language', self._langCode,
+                '--output-prefix', "%s." % category, '--language', self._langCode,
                 '--duration-log.statistics', '--statistic-output', 'stats.xml',
                 '--tripinfo-output.write-unfinished'], stderr=sys.stderr)
+        self._proc = proc
+        self.parent.after(200, self._poll_sumo, proc, cfg, category)
+
+    def _poll_sumo(self, proc, cfg, category):
+        if proc.poll() is None:
+            self.parent.after(200, self._poll_sumo, proc, cfg, category)
+            return
+        self.ret = proc.returncode
 
         if _DEBUG:
             print("ended", cfg)
 
         # compute score
-        score, totalArrived, complete = _SCORING_FUNCTION[self.category](self.category)
+        score, totalArrived, complete = _SCORING_FUNCTION.get(category, computeScoreFromWaitingTime)(category)
 
         # parse switches
         switch = []
         lastProg = {}
-        tlsfile = os.path.join(BASE, "%s.tlsstate.xml" % self.category)
+        tlsfile = os.path.join(BASE, "%s.tlsstate.xml" % category)
         if os.path.exists(tlsfile):
-            for line in open(tlsfile):
-                m = re.search(r'tlsstate time="(\d+(.\d+)?)" id="([^"]*)" programID="([^"]*)"', line)
-                if m:
-                    tls = m.group(3)
-                    program = m.group(4)
-                    if tls not in lastProg or lastProg[tls] != program:
-                        lastProg[tls] = program
-                        switch += [m.group(3), m.group(1)]
+            with open(tlsfile) as tf:
+                for line in tf:
+                    m = _TLS_RE.search(line)
+                    if m:
+                        tls = m.group(3)
+                        program = m.group(4)
+                        if tls not in lastProg or lastProg[tls] != program:
+                            lastProg[tls] = program
+                            switch += [m.group(3), m.group(1)]
 
         lang = self._language_text
         if _DEBUG:
             print(switch, score, totalArrived, complete)
         if complete:
-            ScoreDialog(self, switch, score, self.category, lang, self.high)
+            ScoreDialog(self, switch, score, category, lang, self.high)
 
         # if ret != 0:
         # quit on error
@@ -451,8 +640,8 @@ class ScoreDialog:
                 Tkinter.Label(self.root, text=(str(idx + 1) + '. ')).grid(row=idx)
                 self.name = Tkinter.Entry(self.root)
                 self.name.grid(row=idx, sticky=Tkinter.W, column=1)
-                self.scoreLabel = Tkinter.Label(self.root, text=str(score),
-                                                bg="pale green").grid(row=idx, column=2)
+                self.scoreLabel = Tkinter.Label(self.root, text=str(score), bg="pale green")
+                self.scoreLabel.grid(row=idx, column=2)
                 self.idx = idx
                 haveHigh = True
                 self.root.title(lang["Congratulations"])
@@ -479,6 +668,8 @@ class ScoreDialog:
             row=1, column=3, rowspan=22)
 
         self.root.grid()
+        # process the pending geometry recomputations of all rows in one go
+        self.root.update_idletasks()
         self.root.bind("<Return>", self.save)
         # self.root.wait_visibility()
         # self.root.grab_set()
@@ -494,29 +685,26 @@ class ScoreDialog:
     def save(self, event=None):
         if self.name and self.name.get():
             name = self.name.get()
-            self.high[self.category].insert(self.idx, (name, self.switch, self.score))
-            self.high[self.category].pop()
+            # the background refresh mutates and pickles the same table
+            with _HIGHSCORE_LOCK:
+                self.high[self.category].insert(self.idx, (name, self.switch, self.score))
+                self.high[self.category].pop()
+                try:
+                    _saveHighscore(self.high)
+                except Exception as e:
+                    print(e)
             self.name.destroy()
             self.name = None
             Tkinter.Label(self.root, text=name, padx=5,
                           bg="pale green").grid(row=self.idx, sticky=Tkinter.W, column=1)
-            try:
-                f = open(_SCOREFILE, 'wb')
-                pickle.dump(self.high, f)
-                f.close()
-            except Exception as e:
-                print(e)
-                pass
 
             if _UPLOAD:
                 printDebug("try to upload score...")
                 try:
-                    conn = httplib.HTTPConnection(_SCORESERVER, timeout=_TIMEOUT)
-                    conn.request("GET", _SCORESCRIPT + "category=%s&name=%s&instance=%s&points=%s" % (
+                    response, content = _serverRequest("category=%s&name=%s&instance=%s&points=%s" % (
                         self.category, name, "_".join(self.switch), self.score))
                     if _DEBUG:
-                        r1 = conn.getresponse()
-                        print(r1.status, r1.reason, r1.read())
+                        print(response.status, response.reason, content)
                     printDebug("SUCCESS")
                 except BaseException:
                     printDebug("FAILED")
@@ -536,7 +724,7 @@ def main():
     addLanguageOption(optParser)
     options = optParser.parse_args()
     setLanguage(options.language)
-    updateLocalMessages()
+    updateLocalMessages(options.language)
 
     if options.stereo:
         for m in stereoModes: